@@ -4,21 +4,45 @@ Uses Playwright (headless Chromium) to check the Australian Business Number
 lookup service at abn.business.gov.au.
 
 Only called when an ABN is explicitly found in a job listing.
+Results are cached for the rest of the day, so an employer with many
+listings only costs one browser launch per day.
 """
 
 import logging
 import re
+from datetime import date
 
 logger = logging.getLogger(__name__)
 
 ABN_DIGITS_PATTERN = re.compile(r'\D')   # Strips non-digits from raw ABN string
 
+# Definitive lookup results for today, keyed by 11-digit ABN. Reset when the
+# date rolls, so memory stays bounded by one day's worth of employers.
+_results_today: dict[str, dict] = {}
+_results_date: date | None = None
+
 
 def _clean_abn(raw_abn: str) -> str:
     """Strip spaces and non-digit characters from an ABN string."""
     return ABN_DIGITS_PATTERN.sub('', raw_abn)
 
 
+def _cached_result(abn_digits: str) -> dict | None:
+    """Return today's cached lookup for this ABN, clearing the cache if the day rolled."""
+    global _results_date
+    today = date.today()
+    if today != _results_date:
+        _results_today.clear()
+        _results_date = today
+    return _results_today.get(abn_digits)
+
+
+def _remember(abn_digits: str, result: dict) -> dict:
+    """Cache a definitive lookup result (found / not found) for the rest of the day."""
+    _results_today[abn_digits] = result
+    return result
+
+
 def verify_abn(raw_abn: str) -> dict:
     """
     Verify an ABN using the ABN Lookup website.
@@ -45,6 +69,11 @@ def verify_abn(raw_abn: str) -> dict:
             'abn_formatted': abn_formatted,
         }
 
+    cached = _cached_result(abn_digits)
+    if cached is not None:
+        logger.info(f"ABN {abn_formatted}: using today's cached result ({cached['status']})")
+        return cached
+
     try:
         from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
@@ -73,12 +102,12 @@ def verify_abn(raw_abn: str) -> dict:
             # Check for "not found" or error
             if 'ABN not found' in page_text or 'No record found' in page_text:
                 browser.close()
-                return {
+                return _remember(abn_digits, {
                     'valid': False,
                     'entity_name': '',
                     'status': 'Not found',
                     'abn_formatted': abn_formatted,
-                }
+                })
 
             # Extract entity name
             entity_name = ''
@@ -117,12 +146,12 @@ def verify_abn(raw_abn: str) -> dict:
             valid = 'active' in status.lower()
             logger.info(f"ABN {abn_formatted}: {entity_name} — {status} (valid={valid})")
 
-            return {
+            return _remember(abn_digits, {
                 'valid': valid,
                 'entity_name': entity_name,
                 'status': status,
                 'abn_formatted': abn_formatted,
-            }
+            })
 
     except ImportError:
         logger.error("Playwright is not installed. Run: pip install playwright && playwright install chromium")
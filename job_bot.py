@@ -5,15 +5,19 @@ background polling across Seek, Indeed, Jora, and remote boards,
 LLM-assisted matching via local Ollama, and ABN verification.
 """
 
+import asyncio
+import contextlib
 import logging
 import os
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from threading import Thread
 
-import requests
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram import Bot, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CallbackQueryHandler,
     CommandHandler,
@@ -26,8 +30,8 @@ from abn_verifier import verify_abn
 from deduplicator import make_dedup_key
 from job_matcher import analyse_job, check_ollama_available, parse_intent
 from job_storage import (
-    add_search, get_profile, get_searches, init_db, insert_job, job_exists,
-    mark_job_matched, mark_job_notified, remove_search, update_job_analysis,
+    add_search, existing_job_keys, get_profile, get_searches, init_db, insert_job,
+    job_exists, mark_job_notified, remove_search, update_job_analysis,
     update_job_platforms, update_search_last_run, upsert_profile,
 )
 from scrapers import get_scrapers_for_location
@@ -49,6 +53,27 @@ logger = logging.getLogger(__name__)
 
 POLL_INTERVAL = int(os.getenv('POLL_INTERVAL_SECONDS', '1800'))  # 30 min default
 
+# Public HTTPS base URL for Telegram webhooks; leave unset to use long polling
+WEBHOOK_URL = os.getenv('WEBHOOK_URL', '')
+WEBHOOK_PORT = int(os.getenv('WEBHOOK_PORT', '8443'))
+# Sent by Telegram in a header with every webhook update; PTB rejects
+# requests without it (1-256 chars of A-Z, a-z, 0-9, _ and -)
+WEBHOOK_SECRET = os.getenv('WEBHOOK_SECRET') or None
+
+# Scrape results are reused for this long, so identical searches from
+# different chats (or an early poll after /search add) share one scrape
+SCRAPE_CACHE_TTL = POLL_INTERVAL // 2
+
+# Bot-wide send budget, kept under Telegram's ~30 messages/second; the limiter
+# also waits out flood control (RetryAfter) up to TELEGRAM_MAX_RETRIES times
+TELEGRAM_MAX_RATE = 28
+TELEGRAM_MAX_RETRIES = 3
+
+# Telegram's message length limit (UTF-16 code units); one search's matches
+# are packed into as few messages as fit, to stay clear of per-chat flood limits
+TELEGRAM_MESSAGE_LIMIT = 4096
+_NOTIFICATION_SEPARATOR = '\n\n——————————\n\n'
+
 # ---------------------------------------------------------------------------
 # In-memory session state (keyed by chat_id)
 # ---------------------------------------------------------------------------
@@ -56,6 +81,17 @@ POLL_INTERVAL = int(os.getenv('POLL_INTERVAL_SECONDS', '1800'))  # 30 min defaul
 # Carries partial params between clarification turns for natural-language search setup
 pending_context: dict[int, dict] = {}
 
+# (keywords, location, days) -> (expires_at, [(platform, jobs), ...])
+_scrape_cache: dict[tuple, tuple[float, list]] = {}
+
+# One long-lived instance per scraper class, so each board's httpx connection
+# pool (keep-alive) is reused across searches and polls
+_scrapers: dict[type, object] = {}
+
+# Set by handlers that add a search so the monitor polls right away
+# instead of waiting out the rest of POLL_INTERVAL
+poll_now = asyncio.Event()
+
 # Holds the working copy of filter settings while the user edits the filter panel
 filter_sessions: dict[int, dict] = {}
 
@@ -68,24 +104,88 @@ awaiting_filter_input: dict[int, dict] = {}
 
 _DAYS_LABELS = {1: '24 hours', 3: '3 days', 7: '1 week', 30: '1 month'}
 
+# Profile summary shell, filled by _format_profile
+_PROFILE_TEMPLATE = (
+    "*Your Profile*\n\n"
+    "Salary: {salary}\n"
+    "Job types: {job_types}\n"
+    "Arrangements: {arrangements}\n"
+    "Experience levels: {experience_levels}\n"
+    "Skills: {skills}\n"
+    "Posted within: {posted_within}"
+)
+
+# Salary figures: integers, floats, thousands separators, optional 'k' suffix
+_SALARY_NUMBER = re.compile(r'[\d,]+(?:\.\d+)?k?', re.IGNORECASE)
+
+# Skill-gap priority → notification icon
+_PRIORITY_ICON = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
+
+# Accepted /profile values, with their sorted display strings built once
+_VALID_JOB_TYPES = frozenset({'full-time', 'part-time', 'contract', 'casual', 'permanent'})
+_VALID_ARRANGEMENTS = frozenset({'onsite', 'hybrid', 'remote', 'on-site'})
+_VALID_JOB_TYPES_STR = ', '.join(sorted(_VALID_JOB_TYPES))
+_VALID_ARRANGEMENTS_STR = ', '.join(sorted(_VALID_ARRANGEMENTS))
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _send_message(bot_token: str, chat_id: int, text: str):
-    """Direct HTTP Telegram message — safe to call from background threads."""
+async def _send_message(bot: Bot, chat_id: int, text: str) -> bool:
+    """
+    Send a notification through the application's bot. Returns True on success.
+    Pacing and flood-control retries are handled by the application's AIORateLimiter.
+    """
     try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        resp = requests.post(
-            url,
-            json={'chat_id': chat_id, 'text': text, 'parse_mode': 'Markdown'},
-            timeout=10,
-        )
-        if resp.status_code != 200:
-            logger.error(f"Telegram send failed: {resp.status_code} — {resp.text[:200]}")
+        await bot.send_message(chat_id=chat_id, text=text, parse_mode='Markdown')
+        return True
     except Exception as e:
         logger.error(f"Telegram send error: {e}")
+        return False
+
+
+def _telegram_len(text: str) -> int:
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _coalesce_notifications(notifications: list[tuple[str, str, str]]):
+    """
+    Group (dedup_key, text, label) notifications into messages within Telegram's
+    length limit. Yields (message_text, group); a card too long to share a
+    message is sent on its own, as before.
+    """
+    group, size = [], 0
+    sep_len = _telegram_len(_NOTIFICATION_SEPARATOR)
+    for item in notifications:
+        length = _telegram_len(item[1])
+        if group and size + sep_len + length > TELEGRAM_MESSAGE_LIMIT:
+            yield _NOTIFICATION_SEPARATOR.join(text for _, text, _ in group), group
+            group, size = [], 0
+        size += length + (sep_len if group else 0)
+        group.append(item)
+    if group:
+        yield _NOTIFICATION_SEPARATOR.join(text for _, text, _ in group), group
+
+
+def _parse_salaries(text: str, limit: int = 2) -> list[float]:
+    """
+    Extract up to `limit` salary figures from free text.
+    Accepts `80000`, `80,000` and `80k` forms; unparseable fragments are skipped.
+    """
+    parsed = []
+    for n in _SALARY_NUMBER.findall(text):
+        n = n.replace(',', '')
+        try:
+            if n.lower().endswith('k'):
+                parsed.append(float(n[:-1]) * 1000)
+            else:
+                parsed.append(float(n))
+        except ValueError:
+            continue
+        if len(parsed) == limit:
+            break
+    return parsed
 
 
 def _format_job_notification(job: dict, analysis: dict, abn_result: dict | None) -> str:
@@ -138,12 +238,11 @@ def _format_job_notification(job: dict, analysis: dict, abn_result: dict | None)
     if skill_gaps:
         lines.append('')
         lines.append('*Skill Gaps:*')
-        priority_icon = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
         for gap in skill_gaps:
             skill = gap.get('skill', '')
             priority = gap.get('priority', 'medium').lower()
             why = gap.get('why', '')
-            icon = priority_icon.get(priority, '•')
+            icon = _PRIORITY_ICON.get(priority, '•')
             lines.append(f"  {icon} {skill} — {why}")
 
     # --- Links ---
@@ -162,6 +261,42 @@ def _format_job_notification(job: dict, analysis: dict, abn_result: dict | None)
     return '\n'.join(lines)
 
 
+def _format_profile(profile: dict) -> str:
+    """Build the profile summary shared by /profile and the chat handler."""
+    salary_min = profile.get('salary_min')
+    salary_max = profile.get('salary_max')
+    if salary_min and salary_max:
+        salary_str = f"${salary_min:,.0f} – ${salary_max:,.0f} per year"
+    elif salary_min:
+        salary_str = f"At least ${salary_min:,.0f} per year"
+    elif salary_max:
+        salary_str = f"Up to ${salary_max:,.0f} per year"
+    else:
+        salary_str = 'Not set'
+
+    days = profile.get('posted_within_days') or 3
+    return _PROFILE_TEMPLATE.format_map({
+        'salary': salary_str,
+        'job_types': ', '.join(profile.get('job_types') or []) or 'Not set',
+        'arrangements': ', '.join(profile.get('arrangements') or []) or 'Not set',
+        'experience_levels': ', '.join(profile.get('experience_levels') or []) or 'Not set',
+        'skills': ', '.join(profile.get('skills') or []) or 'Not set',
+        'posted_within': _DAYS_LABELS.get(days, f'{days} days'),
+    })
+
+
+def _format_search_list(searches: list[dict]) -> str:
+    """Build the active-search listing shared by /search list and the chat handler."""
+    lines = ["*Your active searches:*\n"]
+    for s in searches:
+        last = s.get('last_run') or 'never'
+        if last != 'never':
+            last = last[:16].replace('T', ' ')
+        lines.append(f"*#{s['id']}* — {s['keywords']} in {s['location']}")
+        lines.append(f"   Last checked: {last}\n")
+    return '\n'.join(lines)
+
+
 # ---------------------------------------------------------------------------
 # Filter panel — text + keyboard builders
 # ---------------------------------------------------------------------------
@@ -262,101 +397,293 @@ def _build_filter_keyboard(session: dict) -> InlineKeyboardMarkup:
 
 
 # ---------------------------------------------------------------------------
-# Background monitoring thread
+# Background job monitor
 # ---------------------------------------------------------------------------
 
-def monitor_jobs(bot_token: str):
+def _is_known_job(title: str, company: str, location: str) -> bool:
+    """Scraper callback: True if this job is already in seen_jobs."""
+    return job_exists(make_dedup_key(title, company, location))
+
+
+def _get_scraper(ScraperClass):
+    """Return the shared instance of a scraper class, creating it on first use."""
+    scraper = _scrapers.get(ScraperClass)
+    if scraper is None:
+        scraper = _scrapers[ScraperClass] = ScraperClass(is_known=_is_known_job)
+    return scraper
+
+
+def _run_scraper(ScraperClass, keywords: str, location: str, days: int) -> tuple[str, list[dict]]:
+    """Run one scraper to completion. Returns (platform_name, jobs)."""
+    scraper = _get_scraper(ScraperClass)
+    try:
+        return scraper.platform_name, scraper.search(keywords, location, days=days)
+    except Exception as e:
+        logger.error(f"[{scraper.platform_name}] Search error: {e}")
+        return scraper.platform_name, []
+
+
+def _scrape_all(keywords: str, location: str, days: int) -> list[tuple[str, list[dict]]]:
     """
-    Background daemon thread.
-    Polls all job boards every POLL_INTERVAL seconds for each active search.
+    Run every scraper for a location concurrently.
+    Each scraper targets a different job board and keeps its own request delay,
+    so per-board pacing is unchanged — only the boards overlap in time.
     """
-    logger.info("Job monitoring thread started")
+    scraper_classes = get_scrapers_for_location(location)
+    with ThreadPoolExecutor(max_workers=len(scraper_classes)) as pool:
+        return list(pool.map(
+            lambda cls: _run_scraper(cls, keywords, location, days),
+            scraper_classes,
+        ))
 
-    while True:
-        try:
-            searches = get_searches(active_only=True)
-            if not searches:
-                logger.info("No active searches. Sleeping.")
-                time.sleep(POLL_INTERVAL)
+
+def _scrape_cached(keywords: str, location: str, days: int) -> list[tuple[str, list[dict]]]:
+    """
+    _scrape_all with a TTL cache keyed by the normalised search.
+    Returns fresh job dict copies, since the monitor loop annotates them in place.
+    """
+    key = (keywords.lower().strip(), location.lower().strip(), days)
+    now = time.monotonic()
+
+    cached = _scrape_cache.get(key)
+    if cached and cached[0] > now:
+        logger.info(f"Reusing scrape results for '{keywords}' in {location}")
+        results = cached[1]
+    else:
+        results = _scrape_all(keywords, location, days)
+        for stale in [k for k, (expires, _) in _scrape_cache.items() if expires <= now]:
+            del _scrape_cache[stale]
+        _scrape_cache[key] = (now + SCRAPE_CACHE_TTL, results)
+
+    return [(platform, [dict(job) for job in jobs]) for platform, jobs in results]
+
+
+def _due_searches(early: bool = False) -> list[dict]:
+    """
+    Return the active searches to poll. A regular poll takes every one; an
+    early poll skips searches that already ran within the last half interval.
+    """
+    searches = get_searches(active_only=True)
+    if not searches:
+        logger.info("No active searches. Sleeping.")
+        return []
+    if not early:
+        # last_run is stamped when a search finishes, which can be well into
+        # the previous poll — filtering here would skip it every other cycle
+        return searches
+
+    # An early poll (after /search add) should only pick up the new search —
+    # skip any search that already ran within the last half interval.
+    # last_run is ISO-8601, so a plain string comparison orders it correctly.
+    cutoff = (datetime.now() - timedelta(seconds=POLL_INTERVAL // 2)).isoformat()
+    due = [s for s in searches if not s.get('last_run') or s['last_run'] < cutoff]
+    if len(due) < len(searches):
+        logger.info(f"Skipping {len(searches) - len(due)} search(es) polled recently")
+    return due
+
+
+def _poll_search(search: dict, notify) -> None:
+    """
+    Scrape one search and analyse its new jobs.
+    Blocking (HTTP, Ollama, Playwright) — runs in a worker thread, never on the event loop.
+    Calls notify((dedup_key, notification, log_label)) as soon as each match is found.
+    """
+    chat_id   = search['chat_id']
+    keywords  = search['keywords']
+    location  = search['location']
+    search_id = search['id']
+    profile   = get_profile(chat_id)
+    days      = profile.get('posted_within_days') or 3
+
+    for platform, jobs in _scrape_cached(keywords, location, days):
+        keyed = [
+            (make_dedup_key(
+                job_data.get('title', ''),
+                job_data.get('company', ''),
+                job_data.get('location', ''),
+            ), job_data)
+            for job_data in jobs
+        ]
+        # One lookup for the whole board's results instead of a query per job
+        seen = existing_job_keys(key for key, _ in keyed)
+
+        for dedup_key, job_data in keyed:
+            url = job_data.get('url', '')
+
+            if dedup_key in seen:
+                update_job_platforms(dedup_key, platform, url)
+                continue
+
+            # New job — persist it (and treat repeats later in this batch as seen)
+            seen.add(dedup_key)
+            job_data['dedup_key'] = dedup_key
+            job_data['platforms'] = {platform: url}
+            job_data['search_id'] = search_id
+            insert_job(job_data)
+
+            # Combined LLM analysis: match + summary + red flags + skill gaps
+            analysis = analyse_job(job_data, search, profile)
+            matched = analysis['match']
+
+            # ABN verification (only if ABN found in listing)
+            abn_result = None
+            if matched and job_data.get('abn'):
+                abn_result = verify_abn(job_data['abn'])
+                if not abn_result.get('valid'):
+                    logger.info(
+                        f"ABN check failed for '{job_data.get('title')}' "
+                        f"({abn_result.get('status')}) — skipping notification"
+                    )
+                    matched = False
+
+            # Persist the final verdict once, after the ABN check can overturn it
+            update_job_analysis(dedup_key, analysis, matched=1 if matched else -1)
+            if not matched:
                 continue
 
-            logger.info(f"Running job poll — {len(searches)} active search(es)")
-
-            for search in searches:
-                chat_id   = search['chat_id']
-                keywords  = search['keywords']
-                location  = search['location']
-                search_id = search['id']
-                profile   = get_profile(chat_id)
-                days      = profile.get('posted_within_days') or 3
-
-                for ScraperClass in get_scrapers_for_location(location):
-                    scraper = ScraperClass()
-                    try:
-                        jobs = scraper.search(keywords, location, days=days)
-                    except Exception as e:
-                        logger.error(f"[{scraper.platform_name}] Search error: {e}")
-                        jobs = []
-                    finally:
-                        scraper.close()
-
-                    for job_data in jobs:
-                        platform = scraper.platform_name
-                        url = job_data.get('url', '')
-                        dedup_key = make_dedup_key(
-                            job_data.get('title', ''),
-                            job_data.get('company', ''),
-                            job_data.get('location', ''),
-                        )
-
-                        if job_exists(dedup_key):
-                            update_job_platforms(dedup_key, platform, url)
-                            continue
-
-                        # New job — persist it
-                        job_data['dedup_key'] = dedup_key
-                        job_data['platforms'] = {platform: url}
-                        job_data['search_id'] = search_id
-                        insert_job(job_data)
-
-                        # Combined LLM analysis: match + summary + red flags + skill gaps
-                        analysis = analyse_job(job_data, search, profile)
-                        update_job_analysis(dedup_key, analysis)
-
-                        if not analysis['match']:
-                            mark_job_matched(dedup_key, matched=-1)
-                            continue
-
-                        mark_job_matched(dedup_key, matched=1)
-
-                        # ABN verification (only if ABN found in listing)
-                        abn_result = None
-                        if job_data.get('abn'):
-                            abn_result = verify_abn(job_data['abn'])
-                            if not abn_result.get('valid'):
-                                logger.info(
-                                    f"ABN check failed for '{job_data.get('title')}' "
-                                    f"({abn_result.get('status')}) — skipping notification"
-                                )
-                                mark_job_matched(dedup_key, matched=-1)
-                                continue
-
-                        notification = _format_job_notification(job_data, analysis, abn_result)
-                        _send_message(bot_token, chat_id, notification)
-                        mark_job_notified(dedup_key)
-                        logger.info(
-                            f"Notified chat {chat_id} about: {job_data.get('title')} "
-                            f"@ {job_data.get('company')} "
-                            f"flags={len(analysis['red_flags'])} gaps={len(analysis['skill_gaps'])}"
-                        )
-
-                update_search_last_run(search_id)
+            notify((
+                dedup_key,
+                _format_job_notification(job_data, analysis, abn_result),
+                f"{job_data.get('title')} @ {job_data.get('company')} "
+                f"flags={len(analysis['red_flags'])} gaps={len(analysis['skill_gaps'])}",
+            ))
+
+
+async def _send_notifications(bot: Bot, chat_id: int, notifications: list[tuple[str, str, str]]):
+    """Send (dedup_key, text, label) notifications grouped into as few messages as fit."""
+    for message, group in _coalesce_notifications(notifications):
+        if await _send_message(bot, chat_id, message):
+            sent = group
+        elif len(group) > 1:
+            # Scraped/LLM text is not Markdown-escaped, so one bad card can
+            # get the combined message rejected — retry the cards one by one
+            logger.warning(f"Grouped send to chat {chat_id} failed — sending {len(group)} cards individually")
+            sent = [item for item in group if await _send_message(bot, chat_id, item[1])]
+        else:
+            sent = []
+        for dedup_key, _, label in sent:
+            mark_job_notified(dedup_key)
+            logger.info(f"Notified chat {chat_id} about: {label}")
+
+
+async def _poll_searches(bot: Bot, early: bool = False):
+    """
+    Run one poll: scrape every due search, analyse new jobs and notify matches.
+    `early` marks a poll woken by poll_now rather than the regular cadence.
+    Each search's blocking work runs off-loop in a daemon thread, which hands
+    every match to the event loop as soon as it is found; whatever has queued
+    up while a send is in flight goes out together in the next message.
+    """
+    searches = _due_searches(early)
+    if not searches:
+        return
+
+    logger.info(f"Running job poll — {len(searches)} active search(es)")
+    loop = asyncio.get_running_loop()
+
+    for search in searches:
+        chat_id = search['chat_id']
+        queue: asyncio.Queue = asyncio.Queue()
+        work = _run_in_daemon_thread(
+            _poll_search, search,
+            lambda item: loop.call_soon_threadsafe(queue.put_nowait, item),
+        )
+        # The worker's puts are scheduled before its result is settled, so the
+        # None sentinel always lands after the search's last match
+        work.add_done_callback(lambda _: queue.put_nowait(None))
+
+        finished = False
+        while not finished:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            finished = batch[-1] is None
+            if finished:
+                batch.pop()
+            await _send_notifications(bot, chat_id, batch)
+
+        await work  # re-raise a failed search only after its matches went out
+        update_search_last_run(search['id'])
+
+
+def _run_in_daemon_thread(func, *args) -> asyncio.Future:
+    """
+    Run a blocking function in a daemon thread and return an awaitable for its result.
+    Unlike asyncio.to_thread, an in-flight poll does not hold up process exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(result, error):
+        if future.done():  # awaiting task was cancelled during shutdown
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def runner():
+        result, error = None, None
+        try:
+            result = func(*args)
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(settle, result, error)
+        except RuntimeError:
+            pass  # event loop already closed — the bot is shutting down
+
+    Thread(target=runner, daemon=True).start()
+    return future
 
+
+async def monitor_jobs(application: Application):
+    """
+    Background task on the bot's event loop.
+    Polls all job boards every POLL_INTERVAL seconds, or straight away when a
+    search is added. Each search's blocking work runs off-loop in a daemon thread.
+    """
+    logger.info("Job monitor started")
+    loop = asyncio.get_running_loop()
+    early = False
+    next_regular_poll = loop.time()
+
+    while True:
+        poll_now.clear()
+        if not early:
+            # Only regular polls advance the deadline, so early polls after
+            # /search add never push back the fixed cadence
+            next_regular_poll = loop.time() + POLL_INTERVAL
+        try:
+            await _poll_searches(application.bot, early)
         except Exception as e:
             logger.error(f"Error in monitor_jobs loop: {e}")
 
-        logger.info(f"Poll complete. Next poll in {POLL_INTERVAL // 60} minutes.")
-        time.sleep(POLL_INTERVAL)
+        remaining = max(0, next_regular_poll - loop.time())
+        logger.info(f"Poll complete. Next poll in {remaining / 60:.0f} minutes.")
+        try:
+            await asyncio.wait_for(poll_now.wait(), timeout=remaining)
+            logger.info("New search added — polling early")
+            early = True
+        except asyncio.TimeoutError:
+            early = False
+
+
+async def _start_monitor(application: Application):
+    """post_init hook: schedule the job monitor on the bot's event loop."""
+    application.bot_data['monitor_task'] = asyncio.create_task(monitor_jobs(application))
+
+
+async def _stop_monitor(application: Application):
+    """
+    post_stop hook: cancel the job monitor task and wait for it to finish,
+    while the loop is still running and before the bot's HTTP client closes.
+    """
+    task = application.bot_data.pop('monitor_task', None)
+    if task:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 # ---------------------------------------------------------------------------
@@ -496,18 +823,7 @@ async def _handle_filter_text_input(update: Update, context: ContextTypes.DEFAUL
         return
 
     if field == 'salary':
-        # Match integers, floats, and values ending in 'k'
-        numbers = re.findall(r'[\d,]+(?:\.\d+)?k?', message, re.IGNORECASE)
-        parsed = []
-        for n in numbers[:2]:
-            n = n.replace(',', '')
-            if n.lower().endswith('k'):
-                parsed.append(float(n[:-1]) * 1000)
-            else:
-                try:
-                    parsed.append(float(n))
-                except ValueError:
-                    pass
+        parsed = _parse_salaries(message)
 
         if len(parsed) >= 2:
             session['salary_min'] = min(parsed)
@@ -596,14 +912,7 @@ async def cmd_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
             )
             return
 
-        lines = ["*Your active searches:*\n"]
-        for s in searches:
-            last = s.get('last_run', 'never')
-            if last and last != 'never':
-                last = last[:16].replace('T', ' ')
-            lines.append(f"*#{s['id']}* — {s['keywords']} in {s['location']}")
-            lines.append(f"   Last checked: {last}\n")
-        await update.message.reply_text('\n'.join(lines), parse_mode='Markdown')
+        await update.message.reply_text(_format_search_list(searches), parse_mode='Markdown')
         return
 
     # /search remove <id>
@@ -655,6 +964,7 @@ async def cmd_search(update: Update, context: ContextTypes.DEFAULT_TYPE):
             return
 
         search_id = add_search(chat_id, keywords, location)
+        poll_now.set()
         await update.message.reply_text(
             f"Search #{search_id} added:\n"
             f"*{keywords}* in *{location}*\n\n"
@@ -675,36 +985,7 @@ async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # /profile — view current profile
     if not context.args:
-        profile = get_profile(chat_id)
-        salary_min = profile.get('salary_min')
-        salary_max = profile.get('salary_max')
-
-        if salary_min and salary_max:
-            salary_str = f"${salary_min:,.0f} – ${salary_max:,.0f} per year"
-        elif salary_min:
-            salary_str = f"At least ${salary_min:,.0f} per year"
-        elif salary_max:
-            salary_str = f"Up to ${salary_max:,.0f} per year"
-        else:
-            salary_str = 'Not set'
-
-        types_str = ', '.join(profile.get('job_types') or []) or 'Not set'
-        arr_str   = ', '.join(profile.get('arrangements') or []) or 'Not set'
-        exp_str   = ', '.join(profile.get('experience_levels') or []) or 'Not set'
-        skills_str = ', '.join(profile.get('skills') or []) or 'Not set'
-        days = profile.get('posted_within_days') or 3
-        days_str = _DAYS_LABELS.get(days, f'{days} days')
-
-        msg = (
-            "*Your Profile*\n\n"
-            f"Salary: {salary_str}\n"
-            f"Job types: {types_str}\n"
-            f"Arrangements: {arr_str}\n"
-            f"Experience levels: {exp_str}\n"
-            f"Skills: {skills_str}\n"
-            f"Posted within: {days_str}\n\n"
-            "_Use /filters to edit everything visually._"
-        )
+        msg = _format_profile(get_profile(chat_id)) + "\n\n_Use /filters to edit everything visually._"
         await update.message.reply_text(msg, parse_mode='Markdown')
         return
 
@@ -718,12 +999,11 @@ async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode='Markdown',
             )
             return
-        try:
-            sal_min = float(context.args[1].replace(',', '').replace('k', '000').replace('K', '000'))
-            sal_max = float(context.args[2].replace(',', '').replace('k', '000').replace('K', '000'))
-        except ValueError:
+        parsed = _parse_salaries(' '.join(context.args[1:3]))
+        if len(parsed) < 2:
             await update.message.reply_text("Please provide numeric salary values.")
             return
+        sal_min, sal_max = parsed
         if sal_min >= sal_max:
             await update.message.reply_text("Minimum salary must be less than maximum.")
             return
@@ -744,10 +1024,9 @@ async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode='Markdown',
             )
             return
-        valid = {'full-time', 'part-time', 'contract', 'casual', 'permanent'}
-        types = [t.lower() for t in context.args[1:] if t.lower() in valid]
+        types = [t.lower() for t in context.args[1:] if t.lower() in _VALID_JOB_TYPES]
         if not types:
-            await update.message.reply_text(f"No valid types provided. Valid: {', '.join(sorted(valid))}")
+            await update.message.reply_text(f"No valid types provided. Valid: {_VALID_JOB_TYPES_STR}")
             return
         upsert_profile(chat_id, job_types=types)
         await update.message.reply_text(f"Job types set: {', '.join(types)}")
@@ -763,11 +1042,10 @@ async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 parse_mode='Markdown',
             )
             return
-        valid = {'onsite', 'hybrid', 'remote', 'on-site'}
-        arrangements = [a.lower() for a in context.args[1:] if a.lower() in valid]
+        arrangements = [a.lower() for a in context.args[1:] if a.lower() in _VALID_ARRANGEMENTS]
         if not arrangements:
             await update.message.reply_text(
-                f"No valid arrangements provided. Valid: {', '.join(sorted(valid))}"
+                f"No valid arrangements provided. Valid: {_VALID_ARRANGEMENTS_STR}"
             )
             return
         upsert_profile(chat_id, arrangements=arrangements)
@@ -798,7 +1076,7 @@ async def cmd_system(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show NUC system stats."""
     try:
         checking = await update.message.reply_text("Gathering system stats...")
-        stats = get_system_stats()
+        stats = await asyncio.to_thread(get_system_stats)
         msg = format_system_stats(stats)
         await checking.edit_text(msg, parse_mode='Markdown')
     except Exception as e:
@@ -830,7 +1108,13 @@ async def cmd_chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
     searches = get_searches(chat_id=chat_id, active_only=True)
 
     pending = pending_context.get(chat_id, {})
-    intent = parse_intent(message, profile, searches, pending_partial=pending)
+    # The LLM call can take tens of seconds — run it off the event loop so the
+    # job monitor's sends and the webhook server keep running meanwhile.
+    # Updates are still handled one at a time (no concurrent_updates), so
+    # other chats' commands wait for this reply.
+    intent = await asyncio.to_thread(
+        parse_intent, message, profile, searches, pending_partial=pending,
+    )
 
     action = intent.get('action', 'chat')
     params = intent.get('params', {})
@@ -855,6 +1139,7 @@ async def cmd_chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
         location = params.get('location', '').strip()
         if keywords and location:
             search_id = add_search(chat_id, keywords, location)
+            poll_now.set()
             await update.message.reply_text(
                 llm_reply or f"Search #{search_id} added: *{keywords}* in *{location}*",
                 parse_mode='Markdown',
@@ -874,14 +1159,7 @@ async def cmd_chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 llm_reply or "You have no active searches yet. Tell me what kind of job you're looking for!"
             )
             return
-        lines = ["*Your active searches:*\n"]
-        for s in searches:
-            last = s.get('last_run') or 'never'
-            if last != 'never':
-                last = last[:16].replace('T', ' ')
-            lines.append(f"*#{s['id']}* — {s['keywords']} in {s['location']}")
-            lines.append(f"   Last checked: {last}\n")
-        await update.message.reply_text('\n'.join(lines), parse_mode='Markdown')
+        await update.message.reply_text(_format_search_list(searches), parse_mode='Markdown')
         return
 
     # --- search_remove ---
@@ -909,31 +1187,7 @@ async def cmd_chat(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # --- profile_view ---
     if action == 'profile_view':
-        profile = get_profile(chat_id)
-        sal_min = profile.get('salary_min')
-        sal_max = profile.get('salary_max')
-        salary_str = (
-            f"${sal_min:,.0f} – ${sal_max:,.0f}/yr" if sal_min and sal_max
-            else f"from ${sal_min:,.0f}/yr" if sal_min
-            else f"up to ${sal_max:,.0f}/yr" if sal_max
-            else "not set"
-        )
-        types_str  = ', '.join(profile.get('job_types') or []) or 'not set'
-        arr_str    = ', '.join(profile.get('arrangements') or []) or 'not set'
-        exp_str    = ', '.join(profile.get('experience_levels') or []) or 'not set'
-        skills_str = ', '.join(profile.get('skills') or []) or 'not set'
-        days = profile.get('posted_within_days') or 3
-        days_str = _DAYS_LABELS.get(days, f'{days} days')
-        msg = (
-            "*Your Profile*\n\n"
-            f"Salary: {salary_str}\n"
-            f"Job types: {types_str}\n"
-            f"Arrangements: {arr_str}\n"
-            f"Experience levels: {exp_str}\n"
-            f"Skills: {skills_str}\n"
-            f"Posted within: {days_str}"
-        )
-        await update.message.reply_text(msg, parse_mode='Markdown')
+        await update.message.reply_text(_format_profile(get_profile(chat_id)), parse_mode='Markdown')
         return
 
     # --- profile_salary ---
@@ -1024,7 +1278,17 @@ def main():
             "Job matching will be unavailable until Ollama starts."
         )
 
-    app = Application.builder().token(token).build()
+    app = (
+        Application.builder()
+        .token(token)
+        .rate_limiter(AIORateLimiter(
+            overall_max_rate=TELEGRAM_MAX_RATE,
+            max_retries=TELEGRAM_MAX_RETRIES,
+        ))
+        .post_init(_start_monitor)
+        .post_stop(_stop_monitor)
+        .build()
+    )
 
     app.add_handler(CommandHandler('start',   cmd_start))
     app.add_handler(CommandHandler('help',    cmd_help))
@@ -1038,11 +1302,24 @@ def main():
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, cmd_chat))
     app.add_error_handler(error_handler)
 
-    monitor_thread = Thread(target=monitor_jobs, args=(token,), daemon=True)
-    monitor_thread.start()
     logger.info("Bot started. Press Ctrl+C to stop.")
 
-    app.run_polling(allowed_updates=Update.ALL_TYPES)
+    if WEBHOOK_URL:
+        # Telegram pushes updates to us instead of the bot long-polling getUpdates
+        logger.info(f"Receiving updates via webhook on port {WEBHOOK_PORT}")
+        if not WEBHOOK_SECRET:
+            logger.warning("WEBHOOK_SECRET is not set — the webhook endpoint accepts any caller that knows its URL")
+        app.run_webhook(
+            listen='0.0.0.0',
+            port=WEBHOOK_PORT,
+            url_path=token,
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/{token}",
+            allowed_updates=Update.ALL_TYPES,
+            max_connections=40,
+            secret_token=WEBHOOK_SECRET,
+        )
+    else:
+        app.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
 if __name__ == '__main__':
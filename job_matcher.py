@@ -11,7 +11,12 @@ import logging
 import os
 import re
 
+# Fast decode of Ollama responses and the JSON inside them; orjson.JSONDecodeError
+# subclasses json.JSONDecodeError, so the handlers below catch it
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +24,22 @@ OLLAMA_HOST = os.getenv('OLLAMA_HOST', 'http://localhost:11434')
 OLLAMA_MODEL = os.getenv('OLLAMA_MODEL', 'qwen2.5:3b')
 MATCH_CONFIDENCE_THRESHOLD = 0.6
 
+# One keep-alive session for all Ollama calls (poll thread and chat handler).
+# Connection failures and transient 502/503s (e.g. while Ollama is still loading
+# the model) are retried; read timeouts are not.
+_session = requests.Session()
+_session.mount('http://', HTTPAdapter(
+    pool_maxsize=4,
+    max_retries=Retry(
+        total=2,
+        read=0,  # never re-send after a read timeout — a slow generate would block 3x as long
+        backoff_factor=0.5,
+        status_forcelist=(502, 503),
+        allowed_methods=frozenset({'GET', 'POST'}),
+        raise_on_status=False,
+    ),
+))
+
 _ANALYSIS_PROMPT = """\
 You are a job analysis assistant. Perform FOUR tasks for the job listing below and return ONLY valid JSON.
 
@@ -117,12 +138,15 @@ def _build_analysis_prompt(job: dict, search: dict, profile: dict) -> str:
 def _call_ollama(prompt: str, num_predict: int = 800) -> str | None:
     """Call Ollama generate endpoint. Returns raw response text or None."""
     try:
-        response = requests.post(
+        response = _session.post(
             f"{OLLAMA_HOST}/api/generate",
             json={
                 'model': OLLAMA_MODEL,
                 'prompt': prompt,
                 'stream': False,
+                # Both prompts ask for JSON only; constrained output skips the
+                # fences and preamble the model otherwise spends tokens on
+                'format': 'json',
                 'options': {
                     'temperature': 0.1,
                     'num_predict': num_predict,
@@ -131,7 +155,7 @@ def _call_ollama(prompt: str, num_predict: int = 800) -> str | None:
             timeout=120,
         )
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         return data.get('response', '')
     except requests.exceptions.ConnectionError:
         logger.error(f"Cannot connect to Ollama at {OLLAMA_HOST}. Is it running?")
@@ -165,13 +189,13 @@ def _extract_json(raw: str) -> dict:
             depth -= 1
             if depth == 0:
                 try:
-                    return json.loads(clean[start:i + 1])
+                    return orjson.loads(clean[start:i + 1])
                 except json.JSONDecodeError:
                     break
 
     # Last-ditch: try the whole cleaned string
     try:
-        return json.loads(clean)
+        return orjson.loads(clean)
     except json.JSONDecodeError:
         logger.warning(f"Could not extract JSON from LLM response: {raw[:300]}")
         return {}
@@ -329,7 +353,8 @@ def parse_intent(
         message=message,
     )
 
-    raw = _call_ollama(prompt)
+    # An intent is a short JSON object — well under the 800-token analysis budget
+    raw = _call_ollama(prompt, num_predict=300)
     if not raw:
         return {
             'action': 'chat',
@@ -342,7 +367,7 @@ def parse_intent(
     json_match = re.search(r'\{.*\}', clean, re.DOTALL)
     if json_match:
         try:
-            result = json.loads(json_match.group())
+            result = orjson.loads(json_match.group())
             result.setdefault('action', 'chat')
             result.setdefault('params', {})
             result.setdefault('reply', '')
@@ -361,7 +386,7 @@ def parse_intent(
 def check_ollama_available() -> bool:
     """Return True if Ollama is reachable and the configured model is available."""
     try:
-        response = requests.get(f"{OLLAMA_HOST}/api/tags", timeout=5)
+        response = _session.get(f"{OLLAMA_HOST}/api/tags", timeout=5)
         if response.status_code == 200:
             models = [m['name'] for m in response.json().get('models', [])]
             available = any(OLLAMA_MODEL in m for m in models)
@@ -3,25 +3,42 @@ Job Storage Module
 SQLite persistence layer for profiles, searches, and seen jobs.
 """
 
-import json
 import logging
 import sqlite3
+import threading
 from datetime import datetime
 
+import orjson  # Fast encode/decode of the JSON columns
+
 logger = logging.getLogger(__name__)
 
 DB_FILE = 'jobs.db'
 
+# Parsed profiles by chat_id — read on every search of every poll, written
+# rarely. Entries are dropped by upsert_profile; the lock keeps a concurrent
+# read from re-caching a row that is being replaced.
+_profile_cache: dict[int, dict] = {}
+_profile_lock = threading.Lock()
+
+
+def _dumps(obj) -> str:
+    return orjson.dumps(obj).decode()
+
 
 def get_connection():
     conn = sqlite3.connect(DB_FILE)
     conn.row_factory = sqlite3.Row
+    # Safe under WAL (set in init_db): a crash can lose the last commit, never corrupt
+    conn.execute("PRAGMA synchronous=NORMAL")
     return conn
 
 
 def init_db():
     """Create tables if they don't exist."""
     with get_connection() as conn:
+        # WAL persists in the database file: the poll thread's writes no longer
+        # block handler reads, and commits append instead of rewriting pages.
+        conn.execute("PRAGMA journal_mode=WAL")
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS profiles (
                 chat_id            INTEGER PRIMARY KEY,
@@ -65,6 +82,10 @@ def init_db():
                 analysis     TEXT DEFAULT '{}',
                 FOREIGN KEY(search_id) REFERENCES searches(id)
             );
+
+            -- /search list, /search remove and chat intents filter by chat
+            CREATE INDEX IF NOT EXISTS idx_searches_chat_active
+                ON searches (chat_id, active);
         """)
 
     # Migrations: add columns to existing databases
@@ -89,8 +110,21 @@ def init_db():
 # Profile CRUD
 # ---------------------------------------------------------------------------
 
+def _copy_profile(profile):
+    """Copy a cached profile so callers can mutate the result (including its lists)."""
+    return {k: list(v) if isinstance(v, list) else v for k, v in profile.items()}
+
+
 def get_profile(chat_id):
     """Return profile dict for chat_id, or defaults if not set."""
+    with _profile_lock:
+        profile = _profile_cache.get(chat_id)
+        if profile is None:
+            profile = _profile_cache[chat_id] = _load_profile(chat_id)
+    return _copy_profile(profile)
+
+
+def _load_profile(chat_id):
     with get_connection() as conn:
         row = conn.execute(
             "SELECT * FROM profiles WHERE chat_id = ?", (chat_id,)
@@ -100,10 +134,10 @@ def get_profile(chat_id):
             'chat_id': row['chat_id'],
             'salary_min': row['salary_min'],
             'salary_max': row['salary_max'],
-            'job_types': json.loads(row['job_types'] or '[]'),
-            'arrangements': json.loads(row['arrangements'] or '[]'),
-            'skills': json.loads(row['skills'] or '[]'),
-            'experience_levels': json.loads(row['experience_levels'] or '[]'),
+            'job_types': orjson.loads(row['job_types'] or '[]'),
+            'arrangements': orjson.loads(row['arrangements'] or '[]'),
+            'skills': orjson.loads(row['skills'] or '[]'),
+            'experience_levels': orjson.loads(row['experience_levels'] or '[]'),
             'posted_within_days': row['posted_within_days'] or 3,
             'updated_at': row['updated_at'],
         }
@@ -123,6 +157,8 @@ def get_profile(chat_id):
 def upsert_profile(chat_id, **kwargs):
     """Create or update profile fields. Pass keyword args matching column names."""
     profile = get_profile(chat_id)
+    if all(profile.get(key) == value for key, value in kwargs.items()):
+        return profile  # nothing changed (e.g. filter panel saved as-is) — skip the write
     for key, value in kwargs.items():
         if key in ('job_types', 'arrangements', 'skills'):
             profile[key] = value
@@ -130,36 +166,41 @@ def upsert_profile(chat_id, **kwargs):
             profile[key] = value
     profile['updated_at'] = datetime.now().isoformat()
 
-    with get_connection() as conn:
-        conn.execute("""
-            INSERT INTO profiles
-                (chat_id, salary_min, salary_max, job_types, arrangements, skills,
-                 experience_levels, posted_within_days, updated_at)
-            VALUES
-                (:chat_id, :salary_min, :salary_max, :job_types, :arrangements, :skills,
-                 :experience_levels, :posted_within_days, :updated_at)
-            ON CONFLICT(chat_id) DO UPDATE SET
-                salary_min         = excluded.salary_min,
-                salary_max         = excluded.salary_max,
-                job_types          = excluded.job_types,
-                arrangements       = excluded.arrangements,
-                skills             = excluded.skills,
-                experience_levels  = excluded.experience_levels,
-                posted_within_days = excluded.posted_within_days,
-                updated_at         = excluded.updated_at
-        """, {
-            'chat_id': chat_id,
-            'salary_min': profile['salary_min'],
-            'salary_max': profile['salary_max'],
-            'job_types': json.dumps(profile['job_types']),
-            'arrangements': json.dumps(profile['arrangements']),
-            'skills': json.dumps(profile['skills']),
-            'experience_levels': json.dumps(profile['experience_levels']),
-            'posted_within_days': profile['posted_within_days'],
-            'updated_at': profile['updated_at'],
-        })
+    with _profile_lock:
+        # Drop the cached copy first so a failed write cannot leave it stale
+        _profile_cache.pop(chat_id, None)
+        with get_connection() as conn:
+            conn.execute("""
+                INSERT INTO profiles
+                    (chat_id, salary_min, salary_max, job_types, arrangements, skills,
+                     experience_levels, posted_within_days, updated_at)
+                VALUES
+                    (:chat_id, :salary_min, :salary_max, :job_types, :arrangements, :skills,
+                     :experience_levels, :posted_within_days, :updated_at)
+                ON CONFLICT(chat_id) DO UPDATE SET
+                    salary_min         = excluded.salary_min,
+                    salary_max         = excluded.salary_max,
+                    job_types          = excluded.job_types,
+                    arrangements       = excluded.arrangements,
+                    skills             = excluded.skills,
+                    experience_levels  = excluded.experience_levels,
+                    posted_within_days = excluded.posted_within_days,
+                    updated_at         = excluded.updated_at
+            """, {
+                'chat_id': chat_id,
+                'salary_min': profile['salary_min'],
+                'salary_max': profile['salary_max'],
+                'job_types': _dumps(profile['job_types']),
+                'arrangements': _dumps(profile['arrangements']),
+                'skills': _dumps(profile['skills']),
+                'experience_levels': _dumps(profile['experience_levels']),
+                'posted_within_days': profile['posted_within_days'],
+                'updated_at': profile['updated_at'],
+            })
+        # Cache what was just written rather than reading it straight back
+        _profile_cache[chat_id] = _copy_profile(profile)
     logger.info(f"Profile updated for chat {chat_id}")
-    return get_profile(chat_id)
+    return _copy_profile(profile)
 
 
 # ---------------------------------------------------------------------------
@@ -229,6 +270,19 @@ def job_exists(dedup_key):
     return row is not None
 
 
+def existing_job_keys(dedup_keys):
+    """Return the subset of dedup_keys already in seen_jobs, in a single query."""
+    keys = list(dedup_keys)
+    if not keys:
+        return set()
+    placeholders = ','.join('?' * len(keys))
+    with get_connection() as conn:
+        rows = conn.execute(
+            f"SELECT dedup_key FROM seen_jobs WHERE dedup_key IN ({placeholders})", keys
+        ).fetchall()
+    return {row['dedup_key'] for row in rows}
+
+
 def get_job_by_key(dedup_key):
     """Return full job record by dedup_key, or None."""
     with get_connection() as conn:
@@ -237,7 +291,7 @@ def get_job_by_key(dedup_key):
         ).fetchone()
     if row:
         d = dict(row)
-        d['platforms'] = json.loads(d['platforms'] or '{}')
+        d['platforms'] = orjson.loads(d['platforms'] or '{}')
         return d
     return None
 
@@ -248,7 +302,7 @@ def insert_job(job):
     `job['platforms']` should be a dict (will be JSON-serialised).
     Returns the new row id.
     """
-    platforms = json.dumps(job.get('platforms', {}))
+    platforms = _dumps(job.get('platforms', {}))
     now = datetime.now().isoformat()
     with get_connection() as conn:
         cursor = conn.execute("""
@@ -276,15 +330,17 @@ def insert_job(job):
 
 def update_job_platforms(dedup_key, platform, url):
     """Add or update a platform URL for an existing job."""
-    job = get_job_by_key(dedup_key)
-    if not job:
-        return
-    platforms = job['platforms']
-    platforms[platform] = url
+    # Patch the one key in SQL rather than loading and rewriting the whole row;
+    # the WHERE clause skips the write when the URL is already recorded.
+    path = f'$."{platform}"'
     with get_connection() as conn:
         conn.execute(
-            "UPDATE seen_jobs SET platforms = ? WHERE dedup_key = ?",
-            (json.dumps(platforms), dedup_key)
+            """
+            UPDATE seen_jobs SET platforms = json_set(COALESCE(platforms, '{}'), ?, ?)
+            WHERE dedup_key = ?
+              AND json_extract(COALESCE(platforms, '{}'), ?) IS NOT ?
+            """,
+            (path, url, dedup_key, path, url)
         )
 
 
@@ -304,10 +360,19 @@ def mark_job_notified(dedup_key):
         )
 
 
-def update_job_analysis(dedup_key: str, analysis: dict):
-    """Store the full LLM analysis result for a job."""
+def update_job_analysis(dedup_key: str, analysis: dict, matched: int | None = None):
+    """
+    Store the full LLM analysis result for a job.
+    Pass `matched` to record the match status in the same write.
+    """
     with get_connection() as conn:
-        conn.execute(
-            "UPDATE seen_jobs SET analysis = ? WHERE dedup_key = ?",
-            (json.dumps(analysis), dedup_key)
-        )
+        if matched is None:
+            conn.execute(
+                "UPDATE seen_jobs SET analysis = ? WHERE dedup_key = ?",
+                (_dumps(analysis), dedup_key)
+            )
+        else:
+            conn.execute(
+                "UPDATE seen_jobs SET analysis = ?, matched = ? WHERE dedup_key = ?",
+                (_dumps(analysis), matched, dedup_key)
+            )
@@ -1,3 +1,5 @@
+import re
+
 from .seek_scraper import SeekScraper
 from .indeed_scraper import IndeedScraper
 from .jora_scraper import JoraScraper
@@ -17,6 +19,17 @@ _EUROPEAN_KEYWORDS = {
 }
 
 
+def _keyword_pattern(keywords):
+    """One compiled alternation that matches if any keyword is a substring."""
+    return re.compile('|'.join(re.escape(kw) for kw in sorted(keywords, key=len, reverse=True)))
+
+
+# Built once at import: a single regex scan per lookup instead of one
+# substring search per keyword
+_REMOTE_RE = _keyword_pattern(_REMOTE_KEYWORDS)
+_EUROPEAN_RE = _keyword_pattern(_EUROPEAN_KEYWORDS)
+
+
 def get_scrapers_for_location(location: str) -> list:
     """
     Return the appropriate list of scraper classes for the given location string.
@@ -27,10 +40,10 @@ def get_scrapers_for_location(location: str) -> list:
     """
     loc_lower = location.lower()
 
-    if any(kw in loc_lower for kw in _REMOTE_KEYWORDS):
+    if _REMOTE_RE.search(loc_lower):
         return [RemoteScraper, IndeedScraper]
 
-    if any(kw in loc_lower for kw in _EUROPEAN_KEYWORDS):
+    if _EUROPEAN_RE.search(loc_lower):
         return [IndeedScraper, JoraScraper]
 
     # Default: Australian search
@@ -4,6 +4,7 @@ Shared httpx client, rate limiting, retry logic, and abstract interface.
 """
 
 import logging
+import re
 import time
 from abc import ABC, abstractmethod
 
@@ -26,13 +27,28 @@ REQUEST_DELAY = 2      # seconds between requests
 MAX_RETRIES = 3
 TIMEOUT = 15           # seconds
 
+# Shared by every scraper's detail parsing
+ABN_PATTERN = re.compile(r'\bABN:?\s*(\d{2}\s?\d{3}\s?\d{3}\s?\d{3})\b', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s')
+
+
+def find_abn(text: str) -> str | None:
+    """Return the first ABN mentioned in text as 11 bare digits, or None."""
+    match = ABN_PATTERN.search(text)
+    return _WHITESPACE.sub('', match.group(1)) if match else None
+
 
 class BaseScraper(ABC):
     """Abstract base class for all job board scrapers."""
 
     platform_name: str = 'unknown'
 
-    def __init__(self):
+    def __init__(self, is_known=None):
+        """
+        `is_known(title, company, location) -> bool` lets the caller report jobs it
+        has already stored, so their detail pages are not fetched again.
+        """
+        self.is_known = is_known
         self.client = httpx.Client(
             headers=HEADERS,
             follow_redirects=True,
@@ -70,6 +86,10 @@ class BaseScraper(ABC):
                 time.sleep(5 * attempt)
         return None
 
+    def _known(self, title: str, company: str, location: str) -> bool:
+        """True if the caller has already stored this job (detail fetch can be skipped)."""
+        return bool(self.is_known and self.is_known(title, company, location))
+
     @abstractmethod
     def search(self, keywords: str, location: str, days: int = 3) -> list[dict]:
         """
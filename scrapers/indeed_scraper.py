@@ -4,15 +4,13 @@ Selects the correct Indeed country domain based on the location string.
 """
 
 import logging
-import re
 import urllib.parse
+from functools import lru_cache
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, find_abn
 
 logger = logging.getLogger(__name__)
 
-ABN_PATTERN = re.compile(r'\bABN:?\s*(\d{2}\s?\d{3}\s?\d{3}\s?\d{3})\b', re.IGNORECASE)
-
 # Maps lowercase location keywords → Indeed domain
 COUNTRY_DOMAINS = {
     # Australia (default)
@@ -92,6 +90,7 @@ COUNTRY_DOMAINS = {
 _REMOTE_PARAM = 'remotejob=032b3046-06a3-4876-8dfd-474eb5e7ed11'
 
 
+@lru_cache(maxsize=256)
 def _get_domain(location: str) -> tuple[str, bool]:
     """
     Return (indeed_domain, is_remote_filter) for a given location string.
@@ -198,7 +197,10 @@ class IndeedScraper(BaseScraper):
             if not title or not job_url:
                 return None
 
-            description, job_type, arrangement, abn = self._fetch_detail(job_url)
+            if self._known(title, company, job_location):
+                description, job_type, arrangement, abn = '', '', '', None
+            else:
+                description, job_type, arrangement, abn = self._fetch_detail(job_url)
 
             return {
                 'title': title,
@@ -228,13 +230,15 @@ class IndeedScraper(BaseScraper):
 
         job_type = ''
         for el in soup.find_all('div', attrs={'data-testid': True}):
-            text = el.get_text(strip=True).lower()
-            if any(t in text for t in ('full-time', 'part-time', 'contract', 'casual', 'permanent')):
-                job_type = el.get_text(strip=True)
+            text = el.get_text(strip=True)
+            text_lower = text.lower()
+            if any(t in text_lower for t in ('full-time', 'part-time', 'contract', 'casual', 'permanent')):
+                job_type = text
                 break
 
         arrangement = ''
-        full_text_lower = soup.get_text().lower()
+        full_text = soup.get_text()  # walked once, reused for arrangement and ABN
+        full_text_lower = full_text.lower()
         if 'remote' in full_text_lower:
             arrangement = 'Remote'
         elif 'hybrid' in full_text_lower:
@@ -242,9 +246,6 @@ class IndeedScraper(BaseScraper):
         elif 'on-site' in full_text_lower or 'onsite' in full_text_lower:
             arrangement = 'On-site'
 
-        abn = None
-        abn_match = ABN_PATTERN.search(soup.get_text())
-        if abn_match:
-            abn = re.sub(r'\s', '', abn_match.group(1))
+        abn = find_abn(full_text)
 
         return description, job_type, arrangement, abn
@@ -4,15 +4,13 @@ Selects the correct Jora subdomain based on location.
 """
 
 import logging
-import re
 import urllib.parse
+from functools import lru_cache
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, find_abn
 
 logger = logging.getLogger(__name__)
 
-ABN_PATTERN = re.compile(r'\bABN:?\s*(\d{2}\s?\d{3}\s?\d{3}\s?\d{3})\b', re.IGNORECASE)
-
 COUNTRY_DOMAINS = {
     'australia':        'au.jora.com',
     'melbourne':        'au.jora.com',
@@ -40,6 +38,7 @@ COUNTRY_DOMAINS = {
 }
 
 
+@lru_cache(maxsize=256)
 def _get_domain(location: str) -> str:
     loc_lower = location.lower()
     for keyword, domain in COUNTRY_DOMAINS.items():
@@ -144,7 +143,10 @@ class JoraScraper(BaseScraper):
                 return None
 
             # Fetch Jora detail page for description
-            description, job_type, arrangement, abn = self._fetch_detail(job_url)
+            if self._known(title, company, location):
+                description, job_type, arrangement, abn = '', '', '', None
+            else:
+                description, job_type, arrangement, abn = self._fetch_detail(job_url)
 
             return {
                 'title': title,
@@ -178,7 +180,8 @@ class JoraScraper(BaseScraper):
 
         # Job type
         job_type = ''
-        full_text_lower = soup.get_text().lower()
+        full_text = soup.get_text()  # walked once, reused for type, arrangement and ABN
+        full_text_lower = full_text.lower()
         for t in ('full-time', 'full time', 'part-time', 'part time', 'contract', 'casual', 'permanent'):
             if t in full_text_lower:
                 job_type = t.title()
@@ -194,9 +197,6 @@ class JoraScraper(BaseScraper):
             arrangement = 'On-site'
 
         # ABN detection
-        abn = None
-        abn_match = ABN_PATTERN.search(soup.get_text())
-        if abn_match:
-            abn = re.sub(r'\s', '', abn_match.group(1))
+        abn = find_abn(full_text)
 
         return description, job_type, arrangement, abn
@@ -6,20 +6,34 @@ Sources:
 """
 
 import logging
-import re
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson  # Much faster decode of the Remotive payload (full HTML descriptions)
 import requests as _requests  # Using requests directly — the API returns JSON, no HTML parsing
 
-from .base_scraper import BaseScraper
+from .base_scraper import BaseScraper, find_abn
 
 logger = logging.getLogger(__name__)
 
-ABN_PATTERN = re.compile(r'\bABN:?\s*(\d{2}\s?\d{3}\s?\d{3}\s?\d{3})\b', re.IGNORECASE)
-
 REMOTIVE_API = 'https://remotive.com/api/remote-jobs'
+REMOTIVE_HEADERS = {'User-Agent': 'Sentry-JobBot/1.0'}
 WWR_SEARCH_URL = 'https://weworkremotely.com/remote-jobs/search'
 
+# Kept across searches and polls so the API's TLS connection is reused
+_remotive_session = _requests.Session()
+_remotive_session.headers.update(REMOTIVE_HEADERS)
+
+# Desired locations that accept listings from any region
+_UNRESTRICTED_LOCATIONS = frozenset({'remote', 'worldwide', 'global', ''})
+
+# (listing regions, desired locations they are incompatible with)
+_EXCLUSION_PAIRS = (
+    (('usa', 'us only', 'united states', 'north america'), ('europe', 'eu', 'uk', 'germany', 'france')),
+    (('europe', 'eu', 'emea'), ('usa', 'us', 'united states', 'australia', 'latam')),
+    (('australia', 'au'), ('europe', 'usa')),
+)
+
 
 class RemoteScraper(BaseScraper):
     platform_name = 'remote'
@@ -30,9 +44,12 @@ class RemoteScraper(BaseScraper):
         `location` is used only for filtering (e.g. "Remote Europe") if present in listing text.
         `days` is accepted for interface compatibility but Remotive does not support date filtering.
         """
-        jobs = []
-        jobs += self._search_remotive(keywords, location)
-        jobs += self._search_wwr(keywords, location)
+        # The two sources are different hosts, so the Remotive API call overlaps
+        # the (paced) WWR page fetches instead of waiting in front of them
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            remotive = pool.submit(self._search_remotive, keywords, location)
+            wwr_jobs = self._search_wwr(keywords, location)
+            jobs = remotive.result() + wwr_jobs
         logger.info(f"[remote] Found {len(jobs)} remote jobs for '{keywords}'")
         return jobs
 
@@ -42,35 +59,32 @@ class RemoteScraper(BaseScraper):
 
     def _search_remotive(self, keywords: str, location: str) -> list[dict]:
         try:
-            resp = _requests.get(
+            resp = _remotive_session.get(
                 REMOTIVE_API,
                 params={'search': keywords, 'limit': 20},
                 timeout=15,
-                headers={'User-Agent': 'Sentry-JobBot/1.0'},
             )
             resp.raise_for_status()
-            data = resp.json()
+            data = orjson.loads(resp.content)
         except Exception as e:
             logger.warning(f"[remotive] API call failed: {e}")
             return []
 
         jobs = []
-        location_lower = location.lower()
+        # Resolved once per search rather than per listing
+        excluding = _excluding_regions(location.lower())
 
         for item in data.get('jobs', []):
             # Optional: filter by candidate_required_location when user specified a region
-            candidate_location = (item.get('candidate_required_location') or '').lower()
-            if location_lower not in ('remote', 'worldwide', 'global', ''):
+            if excluding:
                 # User wants a specific region — skip if listing explicitly excludes it
                 # (e.g. "US Only" when user wants Europe)
-                if candidate_location and _location_excluded(candidate_location, location_lower):
+                candidate_location = (item.get('candidate_required_location') or '').lower()
+                if candidate_location and _location_excluded(candidate_location, excluding):
                     continue
 
             description = item.get('description', '')
-            abn = None
-            abn_match = ABN_PATTERN.search(description)
-            if abn_match:
-                abn = re.sub(r'\s', '', abn_match.group(1))
+            abn = find_abn(description)
 
             jobs.append({
                 'title': item.get('title', ''),
@@ -99,8 +113,11 @@ class RemoteScraper(BaseScraper):
             return []
 
         jobs = []
-        # WWR job listings are in <li> elements inside sections
-        for li in soup.select('li[class*="feature"]') + soup.select('section ul li'):
+        # WWR job listings are in <li> elements inside sections. Featured cards sit
+        # inside those same lists, so use one selector group — soupsieve returns
+        # each element once — rather than concatenating two overlapping selects,
+        # which parsed (and detail-fetched) every featured job twice.
+        for li in soup.select('li[class*="feature"], section ul li'):
             job = self._parse_wwr_card(li, location)
             if job:
                 jobs.append(job)
@@ -131,8 +148,8 @@ class RemoteScraper(BaseScraper):
             if not title or not job_url or title.lower() == 'jobs':
                 return None
 
-            # Fetch detail for description
-            desc_soup = self.get_page(job_url)
+            # Fetch detail for description (skipped for jobs already stored)
+            desc_soup = None if self._known(title, company, job_location) else self.get_page(job_url)
             description = ''
             abn = None
             if desc_soup:
@@ -141,9 +158,7 @@ class RemoteScraper(BaseScraper):
                     desc_el = desc_soup.find('div', id=lambda i: i and 'job' in (i or '').lower())
                 if desc_el:
                     description = desc_el.get_text(separator=' ', strip=True)
-                abn_match = ABN_PATTERN.search(desc_soup.get_text())
-                if abn_match:
-                    abn = re.sub(r'\s', '', abn_match.group(1))
+                abn = find_abn(desc_soup.get_text())
 
             return {
                 'title': title,
@@ -162,23 +177,32 @@ class RemoteScraper(BaseScraper):
             return None
 
 
-def _location_excluded(candidate_location: str, desired_location: str) -> bool:
+def _excluding_regions(desired_location: str) -> tuple[str, ...]:
+    """
+    Return the listing-region keywords that rule out the desired location,
+    or () when the user asked for remote / worldwide (nothing is excluded).
+
+    Examples:
+      desired="europe"  → ('usa', 'us only', 'united states', 'north america', 'australia', 'au')
+      desired="remote"  → ()
+    """
+    if desired_location in _UNRESTRICTED_LOCATIONS:
+        return ()
+    return tuple(
+        region
+        for exclusive_regions, incompatible_with in _EXCLUSION_PAIRS
+        if any(r in desired_location for r in incompatible_with)
+        for region in exclusive_regions
+    )
+
+
+def _location_excluded(candidate_location: str, excluding: tuple[str, ...]) -> bool:
     """
     Return True if the listing's candidate_required_location explicitly
     restricts to a region that does NOT include the desired location.
 
-    Examples:
-      candidate="usa only", desired="europe" → True (excluded)
-      candidate="europe", desired="germany"  → False (compatible)
-      candidate="worldwide", desired="europe" → False (compatible)
+    Examples (desired="europe"):
+      candidate="usa only"  → True (excluded)
+      candidate="worldwide" → False (compatible)
     """
-    exclusion_pairs = [
-        (['usa', 'us only', 'united states', 'north america'], ['europe', 'eu', 'uk', 'germany', 'france']),
-        (['europe', 'eu', 'emea'], ['usa', 'us', 'united states', 'australia', 'latam']),
-        (['australia', 'au'], ['europe', 'usa']),
-    ]
-    for exclusive_regions, incompatible_with in exclusion_pairs:
-        if any(r in candidate_location for r in exclusive_regions):
-            if any(r in desired_location for r in incompatible_with):
-                return True
-    return False
+    return any(r in candidate_location for r in excluding)
@@ -7,12 +7,10 @@ import logging
 import re
 import time
 
-from .base_scraper import BaseScraper, REQUEST_DELAY
+from .base_scraper import BaseScraper, REQUEST_DELAY, find_abn
 
 logger = logging.getLogger(__name__)
 
-ABN_PATTERN = re.compile(r'\bABN:?\s*(\d{2}\s?\d{3}\s?\d{3}\s?\d{3})\b', re.IGNORECASE)
-
 
 def _slug(text: str) -> str:
     """Convert text to URL-safe slug (lowercase, hyphens)."""
@@ -99,7 +97,10 @@ class SeekScraper(BaseScraper):
             posted_date = date_el.get_text(strip=True) if date_el else ''
 
             # Fetch job detail for description, job type, arrangement, ABN
-            description, job_type, arrangement, abn = self._fetch_detail(job_url)
+            if self._known(title, company, location):
+                description, job_type, arrangement, abn = '', '', '', None
+            else:
+                description, job_type, arrangement, abn = self._fetch_detail(job_url)
 
             return {
                 'title': title,
@@ -142,10 +143,6 @@ class SeekScraper(BaseScraper):
             arrangement = arrangement_el.get_text(strip=True)
 
         # ABN detection
-        abn = None
-        full_text = soup.get_text()
-        abn_match = ABN_PATTERN.search(full_text)
-        if abn_match:
-            abn = re.sub(r'\s', '', abn_match.group(1))
+        abn = find_abn(soup.get_text())
 
         return description, job_type, arrangement, abn
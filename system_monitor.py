@@ -5,10 +5,30 @@ Track NUC hardware stats: CPU, RAM, temperature, disk, network
 
 import psutil
 import logging
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# CPU usage is sampled over this window so it reflects current load; /system
+# calls are rare, so a non-blocking read would average over hours. Callers
+# on the bot's event loop go through asyncio.to_thread.
+CPU_SAMPLE_SECONDS = 0.5
+
+# Repeat /system requests within a few seconds reuse one set of psutil reads
+STATS_CACHE_TTL = 5  # seconds
+_stats_cache = (0.0, None)  # (expires_at, stats)
+
+_INV_GB = 1.0 / (1 << 30)  # bytes → GB as a single multiply
+
+# Usage bars are 20 blocks wide (5% per block); every length is built once here
+_BARS = tuple("█" * i for i in range(21))
+
+
+def _bar(percent):
+    """Return a usage bar for a 0-100 percentage, clamped to 20 blocks"""
+    return _BARS[max(0, min(20, int(percent * 0.2)))]
+
 
 def get_cpu_temperature():
     """Get CPU temperature"""
@@ -18,14 +38,17 @@ def get_cpu_temperature():
 
         if 'coretemp' in temps:
             # Intel CPU temperature
-            core_temps = [temp.current for temp in temps['coretemp']]
-            return sum(core_temps) / len(core_temps)
+            total = count = 0
+            for temp in temps['coretemp']:
+                total += temp.current
+                count += 1
+            return total / count
         elif 'cpu_thermal' in temps:
             # Generic CPU thermal
             return temps['cpu_thermal'][0].current
         elif temps:
             # Get first available temperature sensor
-            first_sensor = list(temps.keys())[0]
+            first_sensor = next(iter(temps))
             return temps[first_sensor][0].current
         else:
             return None
@@ -35,10 +58,15 @@ def get_cpu_temperature():
 
 
 def get_system_stats():
-    """Get comprehensive system statistics"""
+    """Get comprehensive system statistics (cached for STATS_CACHE_TTL seconds)"""
+    global _stats_cache
+    expires_at, cached = _stats_cache
+    if cached is not None and time.monotonic() < expires_at:
+        return cached
+
     try:
         # CPU Usage
-        cpu_percent = psutil.cpu_percent(interval=1)
+        cpu_percent = psutil.cpu_percent(interval=CPU_SAMPLE_SECONDS)
         cpu_count = psutil.cpu_count()
         cpu_freq = psutil.cpu_freq()
 
@@ -72,25 +100,25 @@ def get_system_stats():
                 'temperature_c': cpu_temp
             },
             'memory': {
-                'total_gb': memory.total / (1024 ** 3),
-                'used_gb': memory.used / (1024 ** 3),
-                'available_gb': memory.available / (1024 ** 3),
+                'total_gb': memory.total * _INV_GB,
+                'used_gb': memory.used * _INV_GB,
+                'available_gb': memory.available * _INV_GB,
                 'usage_percent': memory.percent
             },
             'swap': {
-                'total_gb': swap.total / (1024 ** 3),
-                'used_gb': swap.used / (1024 ** 3),
+                'total_gb': swap.total * _INV_GB,
+                'used_gb': swap.used * _INV_GB,
                 'usage_percent': swap.percent
             },
             'disk': {
-                'total_gb': disk.total / (1024 ** 3),
-                'used_gb': disk.used / (1024 ** 3),
-                'free_gb': disk.free / (1024 ** 3),
+                'total_gb': disk.total * _INV_GB,
+                'used_gb': disk.used * _INV_GB,
+                'free_gb': disk.free * _INV_GB,
                 'usage_percent': disk.percent
             },
             'network': {
-                'bytes_sent_gb': net_io.bytes_sent / (1024 ** 3),
-                'bytes_recv_gb': net_io.bytes_recv / (1024 ** 3),
+                'bytes_sent_gb': net_io.bytes_sent * _INV_GB,
+                'bytes_recv_gb': net_io.bytes_recv * _INV_GB,
                 'packets_sent': net_io.packets_sent,
                 'packets_recv': net_io.packets_recv
             },
@@ -101,6 +129,7 @@ def get_system_stats():
             }
         }
 
+        _stats_cache = (time.monotonic() + STATS_CACHE_TTL, stats)
         return stats
 
     except Exception as e:
@@ -108,49 +137,55 @@ def get_system_stats():
         return None
 
 
+def _usage_section(title, used_gb, total_gb, percent, extra):
+    """Render a used/total block with its usage bar (memory, disk)"""
+    return (
+        f"*{title}*\n"
+        f"Usage: {used_gb:.1f}GB / {total_gb:.1f}GB ({percent:.1f}%)\n"
+        f"{_bar(percent)}\n"
+        f"{extra}\n\n"
+    )
+
+
 def format_system_stats(stats):
     """Format system stats into a readable message"""
     if not stats:
         return "❌ Could not retrieve system stats"
 
-    message = "🖥️ *NUC System Status*\n\n"
+    parts = ["🖥️ *NUC System Status*\n\n"]
 
     # CPU
     cpu = stats['cpu']
-    cpu_bar = "█" * int(cpu['usage_percent'] / 5)  # 20 bars max
-    message += f"*CPU ({cpu['count']} cores)*\n"
-    message += f"Usage: {cpu['usage_percent']:.1f}% {cpu_bar}\n"
+    cpu_bar = _bar(cpu['usage_percent'])
+    parts.append(f"*CPU ({cpu['count']} cores)*\n")
+    parts.append(f"Usage: {cpu['usage_percent']:.1f}% {cpu_bar}\n")
     if cpu['frequency_mhz']:
-        message += f"Frequency: {cpu['frequency_mhz']:.0f} MHz\n"
+        parts.append(f"Frequency: {cpu['frequency_mhz']:.0f} MHz\n")
     if cpu['temperature_c']:
         temp_emoji = "🔥" if cpu['temperature_c'] > 70 else "🌡️"
-        message += f"Temperature: {cpu['temperature_c']:.1f}°C {temp_emoji}\n"
-    message += "\n"
+        parts.append(f"Temperature: {cpu['temperature_c']:.1f}°C {temp_emoji}\n")
+    parts.append("\n")
 
     # Memory
     mem = stats['memory']
-    mem_bar = "█" * int(mem['usage_percent'] / 5)
-    message += "*Memory (RAM)*\n"
-    message += f"Usage: {mem['used_gb']:.1f}GB / {mem['total_gb']:.1f}GB ({mem['usage_percent']:.1f}%)\n"
-    message += f"{mem_bar}\n"
-    message += f"Available: {mem['available_gb']:.1f}GB\n"
-    message += "\n"
+    parts.append(_usage_section(
+        "Memory (RAM)", mem['used_gb'], mem['total_gb'], mem['usage_percent'],
+        f"Available: {mem['available_gb']:.1f}GB",
+    ))
 
     # Disk
     disk = stats['disk']
-    disk_bar = "█" * int(disk['usage_percent'] / 5)
-    message += "*Disk (SSD)*\n"
-    message += f"Usage: {disk['used_gb']:.1f}GB / {disk['total_gb']:.1f}GB ({disk['usage_percent']:.1f}%)\n"
-    message += f"{disk_bar}\n"
-    message += f"Free: {disk['free_gb']:.1f}GB\n"
-    message += "\n"
+    parts.append(_usage_section(
+        "Disk (SSD)", disk['used_gb'], disk['total_gb'], disk['usage_percent'],
+        f"Free: {disk['free_gb']:.1f}GB",
+    ))
 
     # Network
     net = stats['network']
-    message += "*Network*\n"
-    message += f"Sent: {net['bytes_sent_gb']:.2f}GB ({net['packets_sent']:,} packets)\n"
-    message += f"Received: {net['bytes_recv_gb']:.2f}GB ({net['packets_recv']:,} packets)\n"
-    message += "\n"
+    parts.append("*Network*\n")
+    parts.append(f"Sent: {net['bytes_sent_gb']:.2f}GB ({net['packets_sent']:,} packets)\n")
+    parts.append(f"Received: {net['bytes_recv_gb']:.2f}GB ({net['packets_recv']:,} packets)\n")
+    parts.append("\n")
 
     # System
     sys = stats['system']
@@ -158,17 +193,17 @@ def format_system_stats(stats):
         uptime_str = f"{sys['uptime_days']:.1f} days"
     else:
         uptime_str = f"{sys['uptime_hours']:.1f} hours"
-    message += "*System*\n"
-    message += f"Uptime: {uptime_str}\n"
-    message += f"Processes: {sys['process_count']}\n"
+    parts.append("*System*\n")
+    parts.append(f"Uptime: {uptime_str}\n")
+    parts.append(f"Processes: {sys['process_count']}\n")
 
-    return message
+    return "".join(parts)
 
 
 def get_quick_stats():
     """Get quick one-line system stats"""
     try:
-        cpu = psutil.cpu_percent(interval=0.5)
+        cpu = psutil.cpu_percent(interval=CPU_SAMPLE_SECONDS)
         mem = psutil.virtual_memory().percent
         temp = get_cpu_temperature()
 